@@ -0,0 +1,200 @@
+#    Copyright 2023 Alireza Aghamohammadi
+
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+
+#        http://www.apache.org/licenses/LICENSE-2.0
+
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+
+import math
+from typing import Tuple
+
+import numpy as np
+
+try:
+    from numba import njit  # type: ignore
+except ImportError:  # pragma: no cover
+
+    def njit(*args, **kwargs):  # type: ignore[no-redef]
+        r"""
+        Fallback for ``numba.njit`` when numba is not installed.
+        The decorated function is returned unchanged.
+        """
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+EPSILON = 1e-8  # Small constant to prevent division by zero
+
+
+@njit(cache=True, fastmath=True)
+def _cos_zenith(
+    sin_latitude: float,
+    cos_latitude: float,
+    solar_declination: float,
+    cos_hour_angles: np.ndarray,
+) -> np.ndarray:
+    r"""
+    Calculate the cosine of the solar zenith angle over the hour angles of one day.
+
+    The terms that only depend on the latitude and the solar declination
+    are computed once, so each hour angle costs a single multiply-add.
+
+    :param sin_latitude: The sine of the observer latitude.
+    :type sin_latitude: float
+    :param cos_latitude: The cosine of the observer latitude.
+    :type cos_latitude: float
+    :param solar_declination: The solar declination in radians.
+    :type solar_declination: float
+    :param cos_hour_angles: A one-dimensional array of the cosine of the hour angles.
+    :type cos_hour_angles: numpy.ndarray
+    :return: The cosine of the solar zenith angle at each hour angle.
+    :rtype: numpy.ndarray
+    """
+    a = sin_latitude * math.sin(solar_declination)
+    b = cos_latitude * math.cos(solar_declination)
+    cos_zenith_angles = np.empty(cos_hour_angles.shape[0])
+    for i in range(cos_hour_angles.shape[0]):
+        cos_zenith_angles[i] = a + b * cos_hour_angles[i]
+    return cos_zenith_angles
+
+
+@njit(cache=True, fastmath=True)
+def _tau_b(a0: float, a1: float, neg_k: float, cos_zenith_angle: float) -> float:
+    r"""
+    Calculate the effective atmospheric transmission coefficient of the direct beam
+    for the given clear-sky components and cosine of the solar zenith angle.
+
+    :param a0: The :math:`a_0` component of clear-sky beam radiation transmittance.
+    :type a0: float
+    :param a1: The :math:`a_1` component of clear-sky beam radiation transmittance.
+    :type a1: float
+    :param neg_k: The negated :math:`k` component of clear-sky beam
+                  radiation transmittance (i.e., :math:`-k`).
+    :type neg_k: float
+    :param cos_zenith_angle: The cosine of the solar zenith angle.
+    :type cos_zenith_angle: float
+    :return: The effective atmospheric transmission coefficient of the direct beam.
+    :rtype: float
+    """
+    if abs(cos_zenith_angle) < EPSILON:
+        return a0
+    return a0 + a1 * math.exp(neg_k / cos_zenith_angle)
+
+
+@njit(cache=True, fastmath=True)
+def _direct_irradiation(
+    cos_hour_angles: np.ndarray,
+    weighted_beam_irradiance: np.ndarray,
+    solar_declination: float,
+    latitude_minus_orientation: float,
+) -> float:
+    r"""
+    Integrate the direct irradiation over the hour angles of a day.
+
+    Only the hour angles where the incidence angle faces the solar panel
+    (i.e., :math:`\cos(\theta) \geq 0`) contribute to the integral.
+
+    :param cos_hour_angles: The cosine of the hour angles between sunrise and sunset.
+    :type cos_hour_angles: numpy.ndarray
+    :param weighted_beam_irradiance: The beam irradiance at each hour angle
+                                     multiplied by its quadrature weight.
+    :type weighted_beam_irradiance: numpy.ndarray
+    :param solar_declination: The solar declination in radians.
+    :type solar_declination: float
+    :param latitude_minus_orientation: The observer latitude minus the
+                                       orientation of the solar panel in radians.
+    :type latitude_minus_orientation: float
+    :return: The direct irradiation in Megajoules per square meter.
+    :rtype: float
+    """
+    # cos(theta) = sin(delta) sin(phi - beta) + cos(delta) cos(phi - beta) cos(omega)
+    a = math.sin(solar_declination) * math.sin(latitude_minus_orientation)
+    b = math.cos(solar_declination) * math.cos(latitude_minus_orientation)
+    direct_irradiation = 0.0
+    for i in range(cos_hour_angles.shape[0]):
+        cos_theta = a + b * cos_hour_angles[i]
+        # Heaviside step function applied without a branch
+        direct_irradiation += weighted_beam_irradiance[i] * max(cos_theta, 0.0)
+    return direct_irradiation
+
+
+INV_GOLDEN_RATIO = (math.sqrt(5.0) - 1.0) / 2.0
+
+
+@njit(cache=True, fastmath=True)
+def _optimal_orientation(
+    cos_hour_angles: np.ndarray,
+    weighted_beam_irradiance: np.ndarray,
+    solar_declination: float,
+    observer_latitude: float,
+    lower: float,
+    upper: float,
+    tolerance: float,
+) -> Tuple[float, float]:
+    r"""
+    Find the orientation of the solar panel that maximizes ``_direct_irradiation``
+    with a golden-section search on ``[lower, upper]``.
+
+    :param cos_hour_angles: The cosine of the hour angles between sunrise and sunset.
+    :type cos_hour_angles: numpy.ndarray
+    :param weighted_beam_irradiance: The beam irradiance at each hour angle
+                                     multiplied by its quadrature weight.
+    :type weighted_beam_irradiance: numpy.ndarray
+    :param solar_declination: The solar declination in radians.
+    :type solar_declination: float
+    :param observer_latitude: The latitude of the observer in radians.
+    :type observer_latitude: float
+    :param lower: The lower bound of the orientation in radians.
+    :type lower: float
+    :param upper: The upper bound of the orientation in radians.
+    :type upper: float
+    :param tolerance: The width of the final bracket in radians.
+    :type tolerance: float
+    :return: The optimal orientation in radians and its direct irradiation.
+    :rtype: tuple of floats
+    """
+    x1 = upper - INV_GOLDEN_RATIO * (upper - lower)
+    x2 = lower + INV_GOLDEN_RATIO * (upper - lower)
+    f1 = _direct_irradiation(
+        cos_hour_angles,
+        weighted_beam_irradiance,
+        solar_declination,
+        observer_latitude - x1,
+    )
+    f2 = _direct_irradiation(
+        cos_hour_angles,
+        weighted_beam_irradiance,
+        solar_declination,
+        observer_latitude - x2,
+    )
+    while upper - lower > tolerance:
+        if f1 < f2:
+            lower, x1, f1 = x1, x2, f2
+            x2 = lower + INV_GOLDEN_RATIO * (upper - lower)
+            f2 = _direct_irradiation(
+                cos_hour_angles,
+                weighted_beam_irradiance,
+                solar_declination,
+                observer_latitude - x2,
+            )
+        else:
+            upper, x2, f2 = x2, x1, f1
+            x1 = upper - INV_GOLDEN_RATIO * (upper - lower)
+            f1 = _direct_irradiation(
+                cos_hour_angles,
+                weighted_beam_irradiance,
+                solar_declination,
+                observer_latitude - x1,
+            )
+    if f1 < f2:
+        return x2, f2
+    return x1, f1
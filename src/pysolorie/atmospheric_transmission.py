@@ -11,8 +11,9 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-import math
+import numpy as np
 
+from ._kernels import EPSILON, _tau_b
 from .model import HottelModel
 from .observer import Observer
 
@@ -22,10 +23,12 @@ class AtmosphericTransmission:
     A class to model the atmospheric transmission.
     """
 
+    __slots__ = ("hottel_model", "a0", "a1", "k", "_neg_k", "observer")
+
     def __init__(
         self,
         climate_type: str,
-        observer_altitude: int,
+        observer_altitude: float,
         observer_latitude: float,
     ):
         r"""
@@ -36,7 +39,8 @@ class AtmosphericTransmission:
         :param climate_type: The type of climate.
         :type climate_type: str
         :param observer_altitude: The altitude of the observer in meters.
-        :type observer_altitude: int
+                                  Any real number is accepted.
+        :type observer_altitude: float
         :param observer_latitude: The latitude of the observer in degrees.
         :type observer_latitude: float
         """
@@ -48,6 +52,7 @@ class AtmosphericTransmission:
         ) = self.hottel_model.calculate_transmittance_components(
             climate_type, observer_altitude
         )
+        self._neg_k = -self.k
         self.observer = Observer(observer_latitude)
 
     def calculate_transmittance(self, day_of_year: int, solar_time: float) -> float:
@@ -75,10 +80,49 @@ class AtmosphericTransmission:
         :rtype: float
         """
 
-        zenith_angle = self.observer.calculate_zenith_angle(day_of_year, solar_time)
-        cos_zenith_angle = math.cos(zenith_angle)
-        EPSILON = 1e-8  # Small constant to prevent division by zero
-        if abs(cos_zenith_angle) < EPSILON:
-            return self.a0
-        else:
-            return self.a0 + self.a1 * math.exp(-self.k / cos_zenith_angle)
+        cos_zenith_angle = self.observer.calculate_cos_zenith_angle(
+            day_of_year, solar_time
+        )
+        return _tau_b(self.a0, self.a1, self._neg_k, cos_zenith_angle)
+
+    def calculate_transmittance_batch(
+        self, day_of_year: np.ndarray, solar_time: np.ndarray
+    ) -> np.ndarray:
+        r"""
+        Calculate the effective atmospheric transmission coefficient of the direct beam
+        for arrays of days and solar times.
+
+        This is the vectorized counterpart of ``calculate_transmittance``.
+        ``day_of_year`` and ``solar_time`` are broadcast against each other.
+
+        :param day_of_year: The days of the year.
+        :type day_of_year: numpy.ndarray
+        :param solar_time: The solar times in seconds.
+        :type solar_time: numpy.ndarray
+        :return: The effective atmospheric transmission coefficients of the direct beam.
+        :rtype: numpy.ndarray
+        """
+        cos_zenith_angle = self.observer.calculate_cos_zenith_angle(
+            np.asarray(day_of_year), np.asarray(solar_time)
+        )
+        return self._calculate_transmittance_from_cos_zenith(cos_zenith_angle)
+
+    def _calculate_transmittance_from_cos_zenith(
+        self, cos_zenith_angle: np.ndarray
+    ) -> np.ndarray:
+        r"""
+        Calculate the effective atmospheric transmission coefficient of the direct beam
+        from the cosine of the solar zenith angle.
+
+        :param cos_zenith_angle: The cosine of the solar zenith angles.
+        :type cos_zenith_angle: numpy.ndarray
+        :return: The effective atmospheric transmission coefficients of the direct beam.
+        :rtype: numpy.ndarray
+        """
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            return np.where(
+                np.abs(cos_zenith_angle) < EPSILON,
+                self.a0,
+                self.a0
+                + self.a1 * np.exp(self._neg_k * np.reciprocal(cos_zenith_angle)),
+            )
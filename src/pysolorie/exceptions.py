@@ -25,32 +25,21 @@ class InvalidClimateTypeError(ValueError):
     :type message: str, optional
     """
 
+    VALID_CLIMATE_TYPES = (
+        "TROPICAL",
+        "MIDLATITUDE SUMMER",
+        "SUBARCTIC SUMMER",
+        "MIDLATITUDE WINTER",
+    )
+    _VALID_SUFFIX = f"Valid climate types are {', '.join(VALID_CLIMATE_TYPES)}"
+
     def __init__(self, climate_type: str, message: Optional[str] = None):
-        self.VALID_CLIMATE_TYPES = [
-            "TROPICAL",
-            "MIDLATITUDE SUMMER",
-            "SUBARCTIC SUMMER",
-            "MIDLATITUDE WINTER",
-        ]
         self.climate_type = climate_type
         if message is None:
-            message = (
-                f"Invalid climate type: {climate_type}. "
-                f"Valid climate types are {', '.join(self.VALID_CLIMATE_TYPES)}"
-            )
+            message = f"Invalid climate type: {climate_type}. {self._VALID_SUFFIX}"
         self.message = message
         super().__init__(self.message)
 
-    def __str__(self) -> str:
-        r"""
-        String representation of the exception.
-
-        :return: formatted string indicating the invalid
-                 climate type and the error message
-        :rtype: str
-        """
-        return f"{self.message}"
-
 
 class MissingObserverLatitudeError(ValueError):
     r"""
@@ -12,9 +12,13 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+import functools
 import math
+from typing import Union, overload
 
-from .sun_position import SunPosition
+import numpy as np
+
+from .sun_position import TWO_PI_OVER_365, SunPosition
 
 
 class SolarIrradiance:
@@ -22,6 +26,14 @@ class SolarIrradiance:
     A class to model the solar irradiance.
     """
 
+    __slots__ = ("sun_position",)
+
+    # Solar constant (MW/m^2)
+    _SC = 1367 * 1e-6
+    # Factor to account for the Earth's orbital eccentricity
+    _ECC = 0.033
+    _SC_ECC = _SC * _ECC
+
     def __init__(self, sun_position: SunPosition):
         r"""
         To instantiate the ``SolarIrradiance`` class, provide the following parameter.
@@ -32,7 +44,17 @@ class SolarIrradiance:
         """
         self.sun_position = sun_position
 
-    def calculate_extraterrestrial_irradiance(self, day_of_year: int) -> float:
+    @overload
+    def calculate_extraterrestrial_irradiance(self, day_of_year: int) -> float: ...
+
+    @overload
+    def calculate_extraterrestrial_irradiance(
+        self, day_of_year: np.ndarray
+    ) -> np.ndarray: ...
+
+    def calculate_extraterrestrial_irradiance(
+        self, day_of_year: Union[int, np.ndarray]
+    ) -> Union[float, np.ndarray]:
         r"""
         Calculate the extraterrestrial solar irradiance for a given day of the year.
 
@@ -58,11 +80,13 @@ class SolarIrradiance:
             in the Earth-Sun distance due to the Earth's elliptical orbit.
         | - :math:`n` is the day of the year (i.e., ``day_of_year``)
 
-        :param day\_of\_year: The day of the year, ranging from 1 to 365.
-        :type day\_of\_year: int
+        :param day\_of\_year: The day of the year, ranging from 1 to 365,
+                            or an array of days of the year.
+        :type day\_of\_year: int or numpy.ndarray
 
         :return: The extraterrestrial solar irradiance in Megawatts per square meter.
-        :rtype: float
+                 An array is returned if ``day_of_year`` is an array.
+        :rtype: float or numpy.ndarray
 
         References
         ----------
@@ -70,15 +94,15 @@ class SolarIrradiance:
                 Solar Engineering of Thermal Processes, Photovoltaics and Wind. Wiley.
         """
 
-        # Solar constant (MW/m^2)
-        SOLAR_CONSTANT = 1367 * 1e-6
+        if isinstance(day_of_year, np.ndarray):
+            return self._SC + self._SC_ECC * np.cos(TWO_PI_OVER_365 * day_of_year)
 
-        # Factor to account for the Earth's orbital eccentricity
-        earth_orbital_eccentricity = 0.033
+        return self._extraterrestrial_irradiance(day_of_year)
 
-        # Calculate the extraterrestrial solar irradiance
-        extraterrestrial_irradiance = SOLAR_CONSTANT * (
-            1 + earth_orbital_eccentricity * math.cos(2 * math.pi * day_of_year / 365)
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _extraterrestrial_irradiance(day_of_year: float) -> float:
+        # Memoized, as reports and optimizations revisit the same days
+        return SolarIrradiance._SC + SolarIrradiance._SC_ECC * math.cos(
+            TWO_PI_OVER_365 * day_of_year
         )
-
-        return extraterrestrial_irradiance
@@ -22,10 +22,14 @@ logging.basicConfig(
 
 
 def logger_decorator(func):
+    # Resolve the logger once when the function is decorated
+    # rather than on every call.
+    logger = logging.getLogger(func.__name__)
+    logger.setLevel(logging.INFO)
+
     @functools.wraps(func)
     def wrapper(self, *args, **kwargs):
-        self.logger = logging.getLogger(func.__name__)
-        self.logger.setLevel(logging.INFO)
+        self.logger = logger
         result = func(self, *args, **kwargs)
         return result
 
@@ -12,7 +12,9 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
-from typing import Dict, Tuple
+from typing import ClassVar, Dict, Tuple, Union, overload
+
+import numpy as np
 
 from .exceptions import InvalidClimateTypeError
 
@@ -57,81 +59,26 @@ class HottelModel:
             Solar Energy, 18(2), 129-134.
     """
 
-    CLIMATE_CONSTANTS: Dict[str, Tuple[float, float, float]] = {
+    CLIMATE_CONSTANTS: ClassVar[Dict[str, Tuple[float, float, float]]] = {
         "TROPICAL": (0.95, 0.98, 1.02),
         "MIDLATITUDE SUMMER": (0.97, 0.99, 1.02),
         "SUBARCTIC SUMMER": (0.99, 0.99, 1.01),
         "MIDLATITUDE WINTER": (1.03, 1.01, 1.00),
     }
 
-    def _convert_to_km(self, observer_altitude: int) -> float:
-        r"""
-        Convert altitude from meters to kilometers.
-
-        :param observer_altitude: Altitude of the observer in meters.
-        :type observer_altitude: float
-        :return: Altitude in kilometers.
-        :rtype: float
-        """
-        return observer_altitude / 1000.0
-
-    def _calculate_a0_star(self, observer_altitude: int) -> float:
-        r"""
-        Calculate :math:`a_0^*` based on observer altitude.
-
-        The formula used to calculate :math:`a_0^*` is:
-
-        .. math::
-            a_0^* = 0.4237 - 0.00821 \times (6 - A)^2
-
-        :param observer_altitude: Altitude of the observer in meters.
-        :type observer_altitude: float
-        :return: :math:`a_0^*` value.
-        :rtype: float
-        """
-        observer_altitude_km = self._convert_to_km(observer_altitude)
-        observer_altitude_diff = 6.0 - observer_altitude_km
-        return 0.4237 - 0.00821 * observer_altitude_diff**2
-
-    def _calculate_a1_star(self, observer_altitude: int) -> float:
-        r"""
-        Calculate :math:`a_1^*` based on observer altitude.
-
-        The formula used to calculate :math:`a_1^*` is:
-
-        .. math::
-            a_1^* = 0.5055 + 0.00595 \times (6.5 - A)^2
-
-        :param observer_altitude: Altitude of the observer in meters.
-        :type observer_altitude: float
-        :return: :math:`a_1^*` value.
-        :rtype: float
-        """
-        observer_altitude_km = self._convert_to_km(observer_altitude)
-        observer_altitude_diff = 6.5 - observer_altitude_km
-        return 0.5055 + 0.00595 * observer_altitude_diff**2
-
-    def _calculate_k_star(self, observer_altitude: int) -> float:
-        r"""
-        Calculate :math:`k^*` based on observer altitude.
-
-        The formula used to calculate :math:`k^*` is:
-
-        .. math::
-            k^* = 0.2711 + 0.01858 \times (2.5 - A)^2
+    @overload
+    def calculate_transmittance_components(
+        self, climate_type: str, observer_altitude: float
+    ) -> Tuple[float, float, float]: ...
 
-        :param observer_altitude: Altitude of the observer in meters.
-        :type observer_altitude: float
-        :return: :math:`k^*` value.
-        :rtype: float
-        """
-        observer_altitude_km = self._convert_to_km(observer_altitude)
-        observer_altitude_diff = 2.5 - observer_altitude_km
-        return 0.2711 + 0.01858 * observer_altitude_diff**2
+    @overload
+    def calculate_transmittance_components(
+        self, climate_type: str, observer_altitude: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]: ...
 
     def calculate_transmittance_components(
-        self, climate_type: str, observer_altitude: int
-    ) -> Tuple[float, float, float]:
+        self, climate_type: str, observer_altitude: Union[float, np.ndarray]
+    ) -> Tuple[Union[float, np.ndarray], ...]:
         r"""
         Calculate the components of clear-sky beam radiation transmittance
         :math:`a_0`, :math:`a_1`, and :math:`k`
@@ -168,24 +115,67 @@ class HottelModel:
                             `Climate Constants`: ``TROPICAL``, ``MIDLATITUDE SUMMER``,
                             ``SUBARCTIC SUMMER``, or ``MIDLATITUDE WINTER``).
         :type climate_type: str
-        :param observer_altitude: Altitude of the observer in meters.
+        :param observer_altitude: Altitude of the observer in meters,
+                                or an array of altitudes.
                                 It is converted to kilometers in the calculations.
-        :type observer_altitude: float
+        :type observer_altitude: float or numpy.ndarray
         :return: Components of clear-sky beam radiation transmittance
                 (:math:`a_0`, :math:`a_1`, :math:`k`).
-        :rtype: tuple of floats
-        :raises ValueError: If an invalid climate type is provided.
+                Each component is an array if ``observer_altitude`` is an array.
+        :rtype: tuple of floats or tuple of numpy.ndarray
+        :raises InvalidClimateTypeError: If an invalid climate type is provided.
         """
-        self.climate_type = climate_type
+        upper_climate_type = climate_type.upper()
+        climate_constants = self.CLIMATE_CONSTANTS.get(upper_climate_type)
+        if climate_constants is None:
+            raise InvalidClimateTypeError(climate_type)
+        self._climate_type = upper_climate_type
 
-        r0, r1, rk = self.CLIMATE_CONSTANTS[self.climate_type]
-
-        a0_star = self._calculate_a0_star(observer_altitude)
-        a1_star = self._calculate_a1_star(observer_altitude)
-        k_star = self._calculate_k_star(observer_altitude)
+        a0_star, a1_star, k_star = self._calculate_altitude_polynomials(
+            observer_altitude
+        )
+        r0, r1, rk = climate_constants
 
         return r0 * a0_star, r1 * a1_star, rk * k_star
 
+    @overload
+    @staticmethod
+    def _calculate_altitude_polynomials(
+        observer_altitude: float,
+    ) -> Tuple[float, float, float]: ...
+
+    @overload
+    @staticmethod
+    def _calculate_altitude_polynomials(
+        observer_altitude: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]: ...
+
+    @staticmethod
+    def _calculate_altitude_polynomials(
+        observer_altitude: Union[float, np.ndarray],
+    ) -> Tuple[Union[float, np.ndarray], ...]:
+        r"""
+        Evaluate the :math:`a_0^*`, :math:`a_1^*`, and :math:`k^*` polynomials
+        in a single pass.
+
+        :param observer_altitude: Altitude of the observer in meters,
+                                  or an array of altitudes.
+        :type observer_altitude: float or numpy.ndarray
+        :return: Components (:math:`a_0^*`, :math:`a_1^*`, :math:`k^*`).
+        :rtype: tuple of floats or tuple of numpy.ndarray
+        """
+        if not isinstance(observer_altitude, np.ndarray):
+            observer_altitude = float(observer_altitude)
+        observer_altitude_km = observer_altitude * 1e-3
+        diff_a0 = 6.0 - observer_altitude_km
+        diff_a1 = 6.5 - observer_altitude_km
+        diff_k = 2.5 - observer_altitude_km
+        return (
+            0.4237 - 0.00821 * diff_a0 * diff_a0,
+            0.5055 + 0.00595 * diff_a1 * diff_a1,
+            0.2711 + 0.01858 * diff_k * diff_k,
+        )
+
     _climate_type: str
 
     @property
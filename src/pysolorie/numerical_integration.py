@@ -12,11 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 import math
+from typing import Dict, Tuple, Union
 
 import numpy as np
-from scipy import integrate, optimize  # type: ignore
+from scipy import integrate  # type: ignore
 
+from ._kernels import _cos_zenith, _direct_irradiation, _optimal_orientation
 from .atmospheric_transmission import AtmosphericTransmission
 from .irradiance import SolarIrradiance
 from .observer import Observer
@@ -40,7 +43,7 @@ class IrradiationCalculator:
     OMEGA = 7.2722 * 1e-5
 
     def __init__(
-        self, climate_type: str, observer_altitude: int, observer_latitude: float
+        self, climate_type: str, observer_altitude: float, observer_latitude: float
     ):
         """
         To instantiate the ``IrradiationCalculator`` class,
@@ -49,7 +52,7 @@ class IrradiationCalculator:
         :param climate_type: The type of climate.
         :type climate_type: str
         :param observer_altitude: The altitude of the observer in meters.
-        :type observer_altitude: int
+        :type observer_altitude: float
         :param observer_latitude: The latitude of the observer in degrees.
         :type observer_latitude: float
         """
@@ -59,54 +62,90 @@ class IrradiationCalculator:
         self._atmospheric_transmission = AtmosphericTransmission(
             climate_type, observer_altitude, observer_latitude
         )
+        # Optimal orientation and direct irradiation memoized per day of the year
+        self._optimal_orientations: Dict[int, Tuple[float, float]] = {}
+        # Orientation-independent part of the integrand memoized per day of the year
+        self._day_profiles: Dict[int, Tuple[np.ndarray, float, np.ndarray]] = {}
 
     @staticmethod
-    def _heaviside(x: float) -> int:
-        """
-        Heaviside step function.
+    @functools.lru_cache(maxsize=None)
+    def _simpson_weights(n: int) -> np.ndarray:
+        r"""
+        Weights of the composite Simpson's rule for ``n`` samples
+        spaced ``0.01`` radians apart.
 
-        :param x: Input to the function.
-        :type x: float
-        :return: 1 if x >= 0, else 0.
-        :rtype: int
-        """
-        return 1 if x >= 0 else 0
+        ``scipy.integrate.simpson`` is linear in its samples, so integrating
+        the identity matrix row by row yields the weight of every sample.
+        The weights are cached per sample count.
 
-    def _calculate_irradiance_component(
-        self, hour_angle: float, panel_orientation: float, day_of_year: int
-    ) -> float:
+        :param n: The number of samples.
+        :type n: int
+        :return: The quadrature weights.
+        :rtype: numpy.ndarray
+        """
+        if not n:
+            return np.empty(0)
+        weights = integrate.simpson(np.eye(n), dx=0.01, axis=-1)
+        weights.flags.writeable = False
+        return weights
+
+    def _calculate_day_profile(
+        self, day_of_year: int
+    ) -> Tuple[np.ndarray, float, np.ndarray]:
         r"""
-        Calculate a component of the irradiance integral.
+        Calculate the parts of the irradiance integrand that do not depend on
+        the orientation of the solar panel.
+        The result is memoized per day of the year, so repeated evaluations
+        of the same day only pay for the orientation-dependent part.
 
-        :param hour_angle: The hour angle.
-        :type hour_angle: float
-        :param panel_orientation: The orientation of the solar panel in radians.
-        :type panel_orientation: float
         :param day_of_year: The day of the year.
         :type day_of_year: int
-        :return: A component of the irradiance integral.
-        :rtype: float
+        :return: The cosine of the hour angles between sunrise and sunset,
+                 the solar declination,
+                 and the beam irradiance :math:`I(n) \times \tau_b / \Omega`
+                 at each hour angle multiplied by its quadrature weight.
+        :rtype: tuple
         """
-        observer_latitude = self._observer._ensure_latitude_provided()
-        solar_declination = self._sun_position.solar_declination(day_of_year)
-        cos_theta = math.sin(solar_declination) * math.sin(
-            observer_latitude - panel_orientation
-        ) + math.cos(solar_declination) * math.cos(hour_angle) * math.cos(
-            observer_latitude - panel_orientation
-        )
-        transmittance = self._atmospheric_transmission.calculate_transmittance(
-            day_of_year, self._sun_position.solar_time(hour_angle)
+        day_profile = self._day_profiles.get(day_of_year)
+        if day_profile is None:
+            day_profile = self._compute_day_profile(day_of_year)
+            self._day_profiles[day_of_year] = day_profile
+        return day_profile
+
+    def _compute_day_profile(
+        self, day_of_year: int
+    ) -> Tuple[np.ndarray, float, np.ndarray]:
+        sunrise_hour_angle, sunset_hour_angle = self._observer.calculate_sunrise_sunset(
+            day_of_year
         )
+        hour_angles = np.arange(sunrise_hour_angle, sunset_hour_angle, 0.01)
+        # The cosine of the hour angles is shared by the zenith angle
+        # and the incidence angle
+        cos_hour_angles = np.cos(hour_angles)
+        solar_declination = self._sun_position.solar_declination(day_of_year)
         irradiance = self._solar_irradiance.calculate_extraterrestrial_irradiance(
             day_of_year
         )
-        return (
-            irradiance
+        cos_zenith_angles = _cos_zenith(
+            self._observer._sin_lat,
+            self._observer._cos_lat,
+            solar_declination,
+            cos_hour_angles,
+        )
+        transmittance = (
+            self._atmospheric_transmission._calculate_transmittance_from_cos_zenith(
+                cos_zenith_angles
+            )
+        )
+        weighted_beam_irradiance = (
+            self._simpson_weights(hour_angles.size)
+            * irradiance
             * transmittance
-            * cos_theta
-            * self._heaviside(cos_theta)
             / self.OMEGA
         )
+        cos_hour_angles.flags.writeable = False
+        weighted_beam_irradiance.flags.writeable = False
+        return cos_hour_angles, solar_declination, weighted_beam_irradiance
 
     def calculate_direct_irradiation(
         self, panel_orientation: float, day_of_year: int
@@ -149,24 +188,23 @@ class IrradiationCalculator:
         :return: The direct irradiation in Megajoules per square meter.
         :rtype: float
         """
-        sunrise_hour_angle, sunset_hour_angle = self._observer.calculate_sunrise_sunset(
-            day_of_year
+        observer_latitude = self._observer._ensure_latitude_provided()
+        cos_hour_angles, solar_declination, beam_irradiance = (
+            self._calculate_day_profile(day_of_year)
         )
-        panel_orientation = math.radians(panel_orientation)
-        irradiance_components = [
-            self._calculate_irradiance_component(
-                hour_angle, panel_orientation, day_of_year
-            )
-            for hour_angle in np.arange(sunrise_hour_angle, sunset_hour_angle, 0.01)
-        ]
 
         # During polar night, the sun doesn't rise and both hour angles are zero.
-        # This results in an empty irradiance_components list. In this case,
+        # This results in an empty cos_hour_angles array. In this case,
         # we return 0 as there is no direct irradiation.
-        if not irradiance_components:
+        if not cos_hour_angles.size:
             return 0
 
-        return integrate.simpson(irradiance_components, dx=0.01)
+        return _direct_irradiation(
+            cos_hour_angles,
+            beam_irradiance,
+            solar_declination,
+            observer_latitude - math.radians(panel_orientation),
+        )
 
     def find_optimal_orientation(self, day_of_year: int) -> float:
         """
@@ -178,22 +216,118 @@ class IrradiationCalculator:
         :return: The optimal orientation (i.e., :math:`beta`) in degrees.
         :rtype: float
         """
+        optimal_beta, _ = self.find_optimal_orientation_and_value(day_of_year)
+        return optimal_beta
 
-        def neg_irradiation(beta: float):
-            # We negate the irradiation because we're minimizing
-            return -self.calculate_direct_irradiation(math.degrees(beta), day_of_year)
+    def find_optimal_orientation_and_value(
+        self, day_of_year: int
+    ) -> Tuple[float, float]:
+        """
+        Find the optimal orientation :math:`beta` that maximizes
+        the direct irradiation, together with the direct irradiation
+        at that orientation.
 
-        result = optimize.minimize_scalar(
-            neg_irradiation, bounds=(-math.pi / 2, math.pi / 2), method="bounded"
+        :param day_of_year: The day of the year.
+        :type day_of_year: int
+        :return: The optimal orientation (i.e., :math:`beta`) in degrees
+                 and the direct irradiation in Megajoules per square meter.
+        :rtype: tuple
+        """
+        optimal_orientation = self._optimal_orientations.get(day_of_year)
+        if optimal_orientation is None:
+            optimal_orientation = self._calculate_optimal_orientation_and_value(
+                day_of_year
+            )
+            self._optimal_orientations[day_of_year] = optimal_orientation
+        return optimal_orientation
+
+    def _calculate_optimal_orientation_and_value(
+        self, day_of_year: int
+    ) -> Tuple[float, float]:
+        # Everything except beta is computed once and passed to
+        # the golden-section search
+        observer_latitude = self._observer._ensure_latitude_provided()
+        cos_hour_angles, solar_declination, beam_irradiance = (
+            self._calculate_day_profile(day_of_year)
         )
-        optimal_beta = result.x
 
-        # Check if irradiance_components is empty
-        if not self.calculate_direct_irradiation(
-            math.degrees(optimal_beta), day_of_year
-        ):
-            observer_latitude = self._observer._ensure_latitude_provided()
+        optimal_beta, direct_irradiation = _optimal_orientation(
+            cos_hour_angles,
+            beam_irradiance,
+            solar_declination,
+            observer_latitude,
+            -math.pi / 2,
+            math.pi / 2,
+            1e-8,
+        )
+
+        # Check if there is no direct irradiation at the optimum
+        if not direct_irradiation:
             # Return 90 or -90 based on observer_latitude
-            return 90 if observer_latitude >= 0 else -90
+            return (90 if observer_latitude >= 0 else -90), 0
+
+        return math.degrees(optimal_beta), float(direct_irradiation)
+
+    def find_optimal_orientation_many(self, days_of_year: np.ndarray) -> np.ndarray:
+        """
+        Find the optimal orientation :math:`beta` for each of several days.
 
-        return math.degrees(optimal_beta)
+        :param days_of_year: The days of the year.
+        :type days_of_year: numpy.ndarray
+        :return: The optimal orientations (i.e., :math:`beta`) in degrees.
+        :rtype: numpy.ndarray
+        """
+        optimal_betas, _ = self.find_optimal_orientation_and_value_many(days_of_year)
+        return optimal_betas
+
+    def find_optimal_orientation_and_value_many(
+        self, days_of_year: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the optimal orientation :math:`beta` and the direct irradiation
+        at that orientation for each of several days.
+
+        :param days_of_year: The days of the year.
+        :type days_of_year: numpy.ndarray
+        :return: The optimal orientations (i.e., :math:`beta`) in degrees
+                 and the direct irradiations in Megajoules per square meter,
+                 as float arrays. Unlike ``find_optimal_orientation_and_value``,
+                 days without direct irradiation therefore give
+                 ``90.0`` (or ``-90.0``) and ``0.0`` rather than integers.
+        :rtype: tuple
+        """
+        days_of_year = np.asarray(days_of_year)
+        optimal_betas = np.empty(days_of_year.shape)
+        direct_irradiations = np.empty(days_of_year.shape)
+        for index, day_of_year in np.ndenumerate(days_of_year):
+            optimal_betas[index], direct_irradiations[index] = (
+                self.find_optimal_orientation_and_value(int(day_of_year))
+            )
+        return optimal_betas, direct_irradiations
+
+    def calculate_direct_irradiation_many(
+        self,
+        panel_orientations: Union[float, np.ndarray],
+        days_of_year: np.ndarray,
+    ) -> np.ndarray:
+        r"""
+        Calculate the direct irradiation for each pair of solar panel orientation
+        and day of the year.
+        ``panel_orientations`` and ``days_of_year`` are broadcast against each other.
+
+        :param panel_orientations: The orientations of the solar panel in degrees.
+        :type panel_orientations: float or numpy.ndarray
+        :param days_of_year: The days of the year.
+        :type days_of_year: numpy.ndarray
+        :return: The direct irradiations in Megajoules per square meter.
+        :rtype: numpy.ndarray
+        """
+        panel_orientations, days_of_year = np.broadcast_arrays(
+            panel_orientations, days_of_year
+        )
+        direct_irradiations = np.empty(days_of_year.shape)
+        for index, day_of_year in np.ndenumerate(days_of_year):
+            direct_irradiations[index] = self.calculate_direct_irradiation(
+                float(panel_orientations[index]), int(day_of_year)
+            )
+        return direct_irradiations
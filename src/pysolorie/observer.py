@@ -12,11 +12,44 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 import math
-from typing import Optional
+from typing import Optional, Tuple, Union, overload
 
+import numpy as np
+
+from ._kernels import _cos_zenith
 from .exceptions import InvalidObserverLatitudeError, MissingObserverLatitudeError
-from .sun_position import SunPosition
+from .sun_position import SECONDS_IN_HALF_DAY, SunPosition
+
+
+@functools.lru_cache(maxsize=4096)
+def _sunrise_sunset(
+    tan_latitude: float, solar_declination: float
+) -> Tuple[float, float]:
+    r"""
+    Calculate the hour angle at sunrise and sunset from the tangent of the
+    observer latitude and the solar declination.
+    The result is memoized, as it only depends on the latitude and the day.
+
+    :param tan_latitude: The tangent of the observer latitude.
+    :type tan_latitude: float
+    :param solar_declination: The solar declination in radians.
+    :type solar_declination: float
+    :return: The hour angle at sunrise and sunset in radians.
+    :rtype: tuple
+    """
+    tan_product = -tan_latitude * math.tan(solar_declination)
+
+    # Clamping covers polar night (the sun never rises, hour angle 0)
+    # and midnight sun (the sun never sets, hour angle pi) without branching
+    # on the result of acos
+    hour_angle = math.acos(min(max(tan_product, -1.0), 1.0))
+
+    sunrise = -hour_angle
+    sunset = hour_angle
+
+    return sunrise, sunset
 
 
 class Observer:
@@ -42,7 +75,19 @@ class Observer:
         self.observer_longitude = observer_longitude
         self.sun_position = SunPosition()
 
-    def calculate_zenith_angle(self, day_of_year: int, solar_time: float) -> float:
+    @overload
+    def calculate_zenith_angle(self, day_of_year: int, solar_time: float) -> float: ...
+
+    @overload
+    def calculate_zenith_angle(
+        self, day_of_year: np.ndarray, solar_time: np.ndarray
+    ) -> np.ndarray: ...
+
+    def calculate_zenith_angle(
+        self,
+        day_of_year: Union[int, np.ndarray],
+        solar_time: Union[float, np.ndarray],
+    ) -> Union[float, np.ndarray]:
         r"""
         Calculate the solar zenith angle.
 
@@ -58,25 +103,115 @@ class Observer:
         | - :math:`\delta` is the solar declination
         | - :math:`\omega` is the hour angle.
 
-        :param day_of_year: The day of the year.
-        :type day_of_year: int
-        :param solar_time: The solar time in seconds.
-        :type solar_time: float
+        :param day_of_year: The day of the year, or an array of days of the year.
+        :type day_of_year: int or numpy.ndarray
+        :param solar_time: The solar time in seconds, or an array of solar times.
+        :type solar_time: float or numpy.ndarray
         :return: The zenith angle in radians.
-        :rtype: float
+                 An array is returned if either argument is an array.
+        :rtype: float or numpy.ndarray
         """
-        observer_latitude = self._ensure_latitude_provided()
+        if isinstance(day_of_year, np.ndarray) or isinstance(solar_time, np.ndarray):
+            return self.calculate_zenith_angle_batch(day_of_year, solar_time)
+
+        if solar_time == SECONDS_IN_HALF_DAY:
+            # At solar noon the hour angle is zero and the formula reduces to
+            # cos(theta_z) = cos(phi - delta), i.e., theta_z = |phi - delta|
+            observer_latitude = self._ensure_latitude_provided()
+            return abs(
+                observer_latitude - self.sun_position.solar_declination(day_of_year)
+            )
+
+        cos_zenith_angle = self.calculate_cos_zenith_angle(day_of_year, solar_time)
+        # Rounding can push the cosine slightly outside [-1, 1]
+        return math.acos(min(max(cos_zenith_angle, -1.0), 1.0))
+
+    def calculate_zenith_angle_batch(
+        self,
+        day_of_year: Union[int, np.ndarray],
+        solar_time: Union[float, np.ndarray],
+    ) -> np.ndarray:
+        r"""
+        Calculate the solar zenith angle for arrays of days and solar times.
 
-        solar_declination = self.sun_position.solar_declination(day_of_year)
-        hour_angle = self.sun_position.hour_angle(solar_time)
-        return math.acos(
-            math.sin(observer_latitude) * math.sin(solar_declination)
-            + math.cos(observer_latitude)
-            * math.cos(solar_declination)
-            * math.cos(hour_angle)
+        This is the vectorized counterpart of ``calculate_zenith_angle``.
+        ``day_of_year`` and ``solar_time`` are broadcast against each other.
+
+        :param day_of_year: The days of the year.
+        :type day_of_year: int or numpy.ndarray
+        :param solar_time: The solar times in seconds.
+        :type solar_time: float or numpy.ndarray
+        :return: The zenith angles in radians.
+        :rtype: numpy.ndarray
+        """
+        cos_zenith_angle = self.calculate_cos_zenith_angle(
+            np.asarray(day_of_year), np.asarray(solar_time)
         )
+        return np.arccos(np.clip(cos_zenith_angle, -1.0, 1.0))
+
+    @overload
+    def calculate_cos_zenith_angle(
+        self, day_of_year: int, solar_time: float
+    ) -> float: ...
+
+    @overload
+    def calculate_cos_zenith_angle(
+        self, day_of_year: np.ndarray, solar_time: np.ndarray
+    ) -> np.ndarray: ...
+
+    def calculate_cos_zenith_angle(
+        self,
+        day_of_year: Union[int, np.ndarray],
+        solar_time: Union[float, np.ndarray],
+    ) -> Union[float, np.ndarray]:
+        r"""
+        Calculate the cosine of the solar zenith angle, i.e.,
+        :math:`\cos(\theta_z)` in ``calculate_zenith_angle``.
+
+        Callers that only need the cosine (e.g., the atmospheric transmission)
+        should use this method to avoid an ``acos`` followed by a ``cos``.
+        The result is not clamped to :math:`[-1, 1]`.
+
+        :param day_of_year: The day of the year, or an array of days of the year.
+        :type day_of_year: int or numpy.ndarray
+        :param solar_time: The solar time in seconds, or an array of solar times.
+        :type solar_time: float or numpy.ndarray
+        :return: The cosine of the zenith angle.
+                 An array is returned if either argument is an array.
+        :rtype: float or numpy.ndarray
+        """
+        self._ensure_latitude_provided()
 
-    def calculate_sunrise_sunset(self, day_of_year: int) -> tuple:
+        solar_declination = self.sun_position.solar_declination(day_of_year)
+        hour_angle = self.sun_position.hour_angle(solar_time)
+        if isinstance(solar_declination, np.ndarray) or isinstance(
+            hour_angle, np.ndarray
+        ):
+            if np.ndim(solar_declination) == 0 and np.ndim(hour_angle) == 1:
+                # A single day over many solar times, as in the irradiation integrand
+                return _cos_zenith(
+                    self._sin_lat,
+                    self._cos_lat,
+                    float(solar_declination),
+                    np.cos(np.asarray(hour_angle, dtype=float)),
+                )
+            return self._sin_lat * np.sin(solar_declination) + self._cos_lat * np.cos(
+                solar_declination
+            ) * np.cos(hour_angle)
+
+        return self._sin_lat * math.sin(solar_declination) + self._cos_lat * math.cos(
+            solar_declination
+        ) * math.cos(hour_angle)
+
+    @overload
+    def calculate_sunrise_sunset(self, day_of_year: int) -> tuple: ...
+
+    @overload
+    def calculate_sunrise_sunset(
+        self, day_of_year: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]: ...
+
+    def calculate_sunrise_sunset(self, day_of_year: Union[int, np.ndarray]) -> tuple:
         r"""
         Calculate the hour angle at sunrise and sunset.
 
@@ -90,29 +225,23 @@ class Observer:
         | - :math:`\phi` is the latitude of the observer
         | - :math:`\delta` is the solar declination.
 
-        :param day_of_year: The day of the year.
-        :type day_of_year: int
+        :param day_of_year: The day of the year, or an array of days of the year.
+        :type day_of_year: int or numpy.ndarray
         :return: The hour angle at sunrise and sunset in radians.
+                 A tuple of arrays is returned if ``day_of_year`` is an array.
         :rtype: tuple
         """
-        observer_latitude = self._ensure_latitude_provided()
+        self._ensure_latitude_provided()
 
         solar_declination = self.sun_position.solar_declination(day_of_year)
 
-        tan_product = -math.tan(observer_latitude) * math.tan(solar_declination)
-
-        if tan_product > 1:
-            return 0, 0
-
-        if tan_product < -1:
-            return -math.pi, math.pi
-
-        hour_angle = math.acos(tan_product)
-
-        sunrise = -hour_angle
-        sunset = hour_angle
+        if isinstance(solar_declination, np.ndarray):
+            hour_angle = np.arccos(
+                np.clip(-self._tan_lat * np.tan(solar_declination), -1.0, 1.0)
+            )
+            return -hour_angle, hour_angle
 
-        return sunrise, sunset
+        return _sunrise_sunset(self._tan_lat, solar_declination)
 
     def _ensure_latitude_provided(self) -> float:
         if self.observer_latitude is None:
@@ -122,6 +251,10 @@ class Observer:
         return self.observer_latitude
 
     _observer_latitude: Optional[float]
+    # Trigonometric functions of the latitude, cached by the setter
+    _sin_lat: float
+    _cos_lat: float
+    _tan_lat: float
 
     @property
     def observer_latitude(self) -> Optional[float]:
@@ -136,12 +269,19 @@ class Observer:
     @observer_latitude.setter
     def observer_latitude(self, value: Optional[float]):
         """
-        Setter for the observer's latitude. Converts the value to radians if not None.
+        Setter for the observer's latitude. Converts the value to radians if not None
+        and caches its sine, cosine, and tangent.
 
         :param value: The observer's latitude in degrees.
         :type value: Optional[float]
         """
-        self._observer_latitude = math.radians(value) if value is not None else None
+        if value is None:
+            self._observer_latitude = None
+            return
+        self._observer_latitude = math.radians(value)
+        self._sin_lat = math.sin(self._observer_latitude)
+        self._cos_lat = math.cos(self._observer_latitude)
+        self._tan_lat = math.tan(self._observer_latitude)
 
     _observer_longitude: Optional[float]
 
@@ -12,10 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import logging
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 
-import matplotlib.pyplot as plt  # type: ignore
+import numpy as np
 
 from .logger import logger_decorator
 from .numerical_integration import IrradiationCalculator
@@ -56,7 +57,7 @@ class Plotter:
         :type savefig_kwargs: dict, optional
         """
 
-        days, betas = self._calculate_optimal_orientations(
+        days, betas, _ = self._calculate_optimal_orientations(
             irradiation_calculator, from_day, to_day
         )
 
@@ -95,13 +96,9 @@ class Plotter:
         :type savefig_kwargs: dict, optional
         """
 
-        days, betas = self._calculate_optimal_orientations(
+        days, _, total_direct_irradiations = self._calculate_optimal_orientations(
             irradiation_calculator, from_day, to_day
         )
-        total_direct_irradiations = [
-            irradiation_calculator.calculate_direct_irradiation(beta, day)
-            for day, beta in zip(days, betas)
-        ]
 
         plot_kwargs = plot_kwargs if plot_kwargs else {}
         savefig_kwargs = savefig_kwargs if savefig_kwargs else {}
@@ -111,31 +108,36 @@ class Plotter:
     @logger_decorator
     def _calculate_optimal_orientations(
         self, irradiation_calculator: IrradiationCalculator, from_day: int, to_day: int
-    ) -> Tuple[List[int], List[float]]:
-        days = []
-        betas = []
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        days = np.arange(from_day, to_day)
+        betas, total_direct_irradiations = (
+            irradiation_calculator.find_optimal_orientation_and_value_many(days)
+        )
 
-        for day in range(from_day, to_day):
-            beta = irradiation_calculator.find_optimal_orientation(day)
-            self.logger.info(  # type: ignore
-                f"On day {day},"
-                + f"the solar panel's optimal orientation is {beta} degrees."
-            )
-            days.append(day)
-            betas.append(beta)
+        logger = self.logger  # type: ignore
+        if logger.isEnabledFor(logging.INFO):
+            for day, beta in zip(days.tolist(), betas.tolist()):
+                logger.info(
+                    "On day %s,the solar panel's optimal orientation is %s degrees.",
+                    day,
+                    beta,
+                )
 
-        return days, betas
+        return days, betas, total_direct_irradiations
 
     def _plot(
         self,
-        days: List[int],
-        betas: List[float],
+        days: Union[List[int], np.ndarray],
+        betas: Union[List[float], np.ndarray],
         path: Optional[Path],
         plot_kwargs: Dict[str, str],
         savefig_kwargs: Dict[str, str],
     ) -> None:
+        # matplotlib is imported lazily, as it is slow to import
+        import matplotlib.pyplot as plt  # type: ignore
+
         figsize = plot_kwargs.get("figsize", (10, 6))
-        _, ax = plt.subplots(figsize=figsize)
+        figure, ax = plt.subplots(figsize=figsize)
         ax.plot(days, betas)
         ax.set_xlabel(plot_kwargs.get("xlabel", "X Axis Title"))
         ax.set_ylabel(plot_kwargs.get("ylabel", "Y Axis Title"))
@@ -144,5 +146,7 @@ class Plotter:
 
         if path is not None:
             plt.savefig(path, **savefig_kwargs)
+            # The figure is only needed for the file, so pyplot releases it
+            plt.close(figure)
         else:
             plt.show()
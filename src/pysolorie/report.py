@@ -14,9 +14,10 @@
 
 import csv
 import json
+import logging
 import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import Dict, List, Union
+from typing import List, Tuple
 
 from .logger import logger_decorator
 from .numerical_integration import IrradiationCalculator
@@ -34,10 +35,12 @@ class ReportGenerator:
         irradiation_calculator: IrradiationCalculator,
         from_day: int,
         to_day: int,
-    ) -> List[Dict[str, Union[int, float]]]:
+    ) -> List[Tuple[int, float, float]]:
         r"""
         This private method calculates the optimal solar panel orientation and
         total direct irradiation for a range of days.
+        All rows are calculated before a report file is opened,
+        so an error never leaves a partially written report behind.
 
         :param irradiation_calculator: An instance of the IrradiationCalculator class.
         :type irradiation_calculator: pysolorie.IrradiationCalculator
@@ -45,36 +48,31 @@ class ReportGenerator:
         :type from_day: int
         :param to_day: The ending day of the report.
         :type to_day: int
-        :return: A list of dictionaries, each containing the day,
+        :return: A list of tuples, each containing the day,
                  optimal orientation (beta),
                  and total direct irradiation.
-        :rtype: List[Dict[str, Union[int, float]]]
+        :rtype: List[Tuple[int, float, float]]
         """
-        data = []
-
-        for day in range(from_day, to_day):
-            beta = irradiation_calculator.find_optimal_orientation(day)
-            total_direct_irradiation = (
-                irradiation_calculator.calculate_direct_irradiation(beta, day)
-            )
-
-            self.logger.info(  # type: ignore
-                f"On day {day}, the solar panel's optimal orientation is "
-                f"{beta} degrees, and the total direct irradiation is "
-                f"{total_direct_irradiation} Megajoules per square meter."
-            )
-
-            # Append the result to the data list
-            data.append(
-                {
-                    "Day": day,
-                    "Beta (degrees)": beta,
-                    "Direct Irradiation "
-                    "(Megajoules per square meter)": total_direct_irradiation,
-                }
-            )
+        # The per-day results are kept as returned by the calculator,
+        # so the polar-night fallback stays an integer in the reports
+        rows = [
+            (day, *irradiation_calculator.find_optimal_orientation_and_value(day))
+            for day in range(from_day, to_day)
+        ]
+
+        logger = self.logger  # type: ignore
+        if logger.isEnabledFor(logging.INFO):
+            for day, beta, total_direct_irradiation in rows:
+                logger.info(
+                    "On day %s, the solar panel's optimal orientation is "
+                    "%s degrees, and the total direct irradiation is "
+                    "%s Megajoules per square meter.",
+                    day,
+                    beta,
+                    total_direct_irradiation,
+                )
 
-        return data
+        return rows
 
     @logger_decorator
     def generate_optimal_orientation_csv_report(
@@ -99,11 +97,12 @@ class ReportGenerator:
         :param to_day: The ending day of the report.
         :type to_day: int
         """
-        data = self._calculate_optimal_orientation_and_irradiation(
+        rows = self._calculate_optimal_orientation_and_irradiation(
             irradiation_calculator, from_day, to_day
         )
 
-        with open(path, "w", newline="") as file:
+        # A large buffer lets the rows reach the disk in few write calls
+        with open(path, "w", newline="", buffering=1 << 20) as file:
             writer = csv.writer(file)
             writer.writerow(
                 [
@@ -112,15 +111,7 @@ class ReportGenerator:
                     "Direct Irradiation (Megajoules per square meter)",
                 ]
             )
-
-            for row in data:
-                writer.writerow(
-                    [
-                        row["Day"],
-                        row["Beta (degrees)"],
-                        row["Direct Irradiation (Megajoules per square meter)"],
-                    ]
-                )
+            writer.writerows(rows)
 
     @logger_decorator
     def generate_optimal_orientation_json_report(
@@ -146,10 +137,20 @@ class ReportGenerator:
         :param to_day: The ending day of the report.
         :type to_day: int
         """
-        data = self._calculate_optimal_orientation_and_irradiation(
+        rows = self._calculate_optimal_orientation_and_irradiation(
             irradiation_calculator, from_day, to_day
         )
 
+        data = [
+            {
+                "Day": day,
+                "Beta (degrees)": beta,
+                "Direct Irradiation "
+                "(Megajoules per square meter)": total_direct_irradiation,
+            }
+            for day, beta, total_direct_irradiation in rows
+        ]
+
         # Write the data list to the JSON file
         with open(path, "w") as file:
             json.dump(data, file, indent=4)
@@ -177,25 +178,23 @@ class ReportGenerator:
         :param to_day: The ending day of the report.
         :type to_day: int
         """
-        data = self._calculate_optimal_orientation_and_irradiation(
+        rows = self._calculate_optimal_orientation_and_irradiation(
             irradiation_calculator, from_day, to_day
         )
 
         # Create the root element
         root = ET.Element("Report")
 
-        for row in data:
+        for day, beta, total_direct_irradiation in rows:
             # Create a 'Day' element for each day
             day_element = ET.SubElement(root, "Day")
-            day_element.set("id", str(row["Day"]))
+            day_element.set("id", str(day))
 
             # Create 'Beta' and 'DirectIrradiation' elements for each day
             beta_element = ET.SubElement(day_element, "Beta")
-            beta_element.text = str(row["Beta (degrees)"])
+            beta_element.text = str(beta)
             tdi_element = ET.SubElement(day_element, "DirectIrradiation")
-            tdi_element.text = str(
-                row["Direct Irradiation (Megajoules per square meter)"]
-            )
+            tdi_element.text = str(total_direct_irradiation)
 
         # Write the XML data to the file
         tree = ET.ElementTree(root)
@@ -12,6 +12,34 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 import math
+from typing import Union, overload
+
+import numpy as np
+
+# tilt of the Earth's axis (in radians)
+EARTH_TILT_RADIANS = math.radians(23.45)
+
+# Offset to ensure declination angle is zero at the March equinox
+EQUINOX_OFFSET_DAYS = 284
+
+# Angular speed of the declination cycle (in radians per day)
+TWO_PI_OVER_365 = 2 * math.pi / 365
+
+# The number of seconds in half a day (12 hours)
+SECONDS_IN_HALF_DAY = 12 * 60 * 60
+
+# The Earth rotates by pi/SECONDS_IN_HALF_DAY radians per second
+EARTH_ROTATION_RATE = math.pi / SECONDS_IN_HALF_DAY
+
+
+# The declination formula is periodic with a period of 365 days,
+# so integer days are looked up in a table indexed by ``day_of_year % 365``
+_SOLAR_DECLINATIONS = (
+    np.sin(TWO_PI_OVER_365 * (EQUINOX_OFFSET_DAYS + np.arange(365)))
+    * EARTH_TILT_RADIANS
+)
+_SOLAR_DECLINATIONS.flags.writeable = False
+_SOLAR_DECLINATIONS_LIST = _SOLAR_DECLINATIONS.tolist()
 
 
 class SunPosition:
@@ -19,7 +47,15 @@ class SunPosition:
     A class to model sun position.
     """
 
-    def solar_declination(self, day_of_year: int) -> float:
+    @overload
+    def solar_declination(self, day_of_year: float) -> float: ...
+
+    @overload
+    def solar_declination(self, day_of_year: np.ndarray) -> np.ndarray: ...
+
+    def solar_declination(
+        self, day_of_year: Union[float, np.ndarray]
+    ) -> Union[float, np.ndarray]:
         r"""
         Calculate the solar declination angle in radians [1]_.
 
@@ -34,34 +70,105 @@ class SunPosition:
 
         | :math:`n` is the day of the year (i.e., ``day_of_year``)
 
-        :param day_of_year: The day of the year.
-        :type day_of_year: int
+        :param day_of_year: The day of the year, or an array of days of the year.
+        :type day_of_year: int or numpy.ndarray
         :return: The solar declination angle in radians.
-        :rtype: float
+                 An array is returned if ``day_of_year`` is an array.
+        :rtype: float or numpy.ndarray
 
         References
         ----------
         .. [1] Cooper, P. (1969). The absorption of radiation in solar stills.
                 Solar Energy, 12(3), 333-346.
         """
-        # tilt of the Earth's axis (in degrees)
-        earth_tilt_degrees = 23.45
+        if isinstance(day_of_year, np.ndarray):
+            if np.issubdtype(day_of_year.dtype, np.integer):
+                return _SOLAR_DECLINATIONS[day_of_year % 365]
+            return (
+                np.sin(TWO_PI_OVER_365 * (EQUINOX_OFFSET_DAYS + day_of_year))
+                * EARTH_TILT_RADIANS
+            )
+
+        if isinstance(day_of_year, (int, np.integer)):
+            return _SOLAR_DECLINATIONS_LIST[day_of_year % 365]
+
+        return (
+            math.sin(TWO_PI_OVER_365 * (EQUINOX_OFFSET_DAYS + day_of_year))
+            * EARTH_TILT_RADIANS
+        )
+
+    @overload
+    def spencer_solar_declination(self, day_of_year: float) -> float: ...
+
+    @overload
+    def spencer_solar_declination(self, day_of_year: np.ndarray) -> np.ndarray: ...
+
+    def spencer_solar_declination(
+        self, day_of_year: Union[float, np.ndarray]
+    ) -> Union[float, np.ndarray]:
+        r"""
+        Calculate the solar declination angle in radians
+        with the Fourier series of Spencer [1]_.
 
-        # Convert the tilt to radians
-        earth_tilt_radians = math.radians(earth_tilt_degrees)
+        This is more accurate than ``solar_declination``
+        (the maximum error is about 0.0006 radians [2]_).
 
-        # Offset to ensure declination angle is zero at the March equinox
-        equinox_offset_days = 284
+        The formula used to calculate the solar declination angle is:
+
+        .. math::
+            \delta = 0.006918 - 0.399912 \cos \Gamma + 0.070257 \sin \Gamma
+            - 0.006758 \cos 2\Gamma + 0.000907 \sin 2\Gamma
+            - 0.002697 \cos 3\Gamma + 0.00148 \sin 3\Gamma
+
+        | :math:`\Gamma = \frac{2\pi~(n - 1)}{365}`
+        | :math:`n` is the day of the year (i.e., ``day_of_year``)
+
+        :param day_of_year: The day of the year, or an array of days of the year.
+        :type day_of_year: int or numpy.ndarray
+        :return: The solar declination angle in radians.
+                 An array is returned if ``day_of_year`` is an array.
+        :rtype: float or numpy.ndarray
 
-        # Calculate the solar declination angle
-        solar_declination = (
-            math.sin((2 * math.pi) * (equinox_offset_days + day_of_year) / 365)
-            * earth_tilt_radians
+        References
+        ----------
+        .. [1] Spencer, J. W. (1971). Fourier series representation
+                of the position of the sun. Search, 2(5), 172.
+        .. [2] Duffie (Deceased), J., Beckman, W., & Blair, N. (2020).
+                Solar Engineering of Thermal Processes, Photovoltaics and Wind. Wiley.
+        """
+        day_angle = TWO_PI_OVER_365 * (day_of_year - 1)
+        cos_day_angle: Union[float, np.ndarray]
+        sin_day_angle: Union[float, np.ndarray]
+        if isinstance(day_angle, np.ndarray):
+            cos_day_angle, sin_day_angle = np.cos(day_angle), np.sin(day_angle)
+        else:
+            cos_day_angle, sin_day_angle = math.cos(day_angle), math.sin(day_angle)
+
+        # The second and third harmonics follow from the multiple-angle formulas,
+        # so a single sine and cosine are evaluated
+        cos_2 = 2 * cos_day_angle * cos_day_angle - 1
+        sin_2 = 2 * sin_day_angle * cos_day_angle
+        cos_3 = cos_day_angle * (2 * cos_2 - 1)
+        sin_3 = sin_day_angle * (2 * cos_2 + 1)
+        return (
+            0.006918
+            - 0.399912 * cos_day_angle
+            + 0.070257 * sin_day_angle
+            - 0.006758 * cos_2
+            + 0.000907 * sin_2
+            - 0.002697 * cos_3
+            + 0.00148 * sin_3
         )
 
-        return solar_declination
+    @overload
+    def hour_angle(self, solar_time: float) -> float: ...
 
-    def hour_angle(self, solar_time: float) -> float:
+    @overload
+    def hour_angle(self, solar_time: np.ndarray) -> np.ndarray: ...
+
+    def hour_angle(
+        self, solar_time: Union[float, np.ndarray]
+    ) -> Union[float, np.ndarray]:
         r"""
         Calculate the hour angle based on the solar time.
 
@@ -74,23 +181,23 @@ class SunPosition:
             \omega = (t - 12\times 60 \times 60)
             \times \frac{\pi}{12\times 60 \times 60}
 
-        :param solar_time: The solar time in seconds.
-        :type solar_time: float
+        :param solar_time: The solar time in seconds, or an array of solar times.
+        :type solar_time: float or numpy.ndarray
         :return: The hour angle in radians.
-        :rtype: float
+                 An array is returned if ``solar_time`` is an array.
+        :rtype: float or numpy.ndarray
         """
-        # The number of seconds in half a day (12 hours)
-        seconds_in_half_day = 12 * 60 * 60
-
-        # The Earth rotates by pi/seconds_in_half_day radians per second
-        earth_rotation_rate = math.pi / seconds_in_half_day
+        return (solar_time - SECONDS_IN_HALF_DAY) * EARTH_ROTATION_RATE
 
-        # Calculate the hour angle
-        hour_angle = (solar_time - seconds_in_half_day) * earth_rotation_rate
+    @overload
+    def solar_time(self, hour_angle: float) -> float: ...
 
-        return hour_angle
+    @overload
+    def solar_time(self, hour_angle: np.ndarray) -> np.ndarray: ...
 
-    def solar_time(self, hour_angle: float) -> float:
+    def solar_time(
+        self, hour_angle: Union[float, np.ndarray]
+    ) -> Union[float, np.ndarray]:
         r"""
         Calculate the solar time based on the hour angle.
 
@@ -102,18 +209,10 @@ class SunPosition:
             t = \omega \times \frac{12 \times 60 \times 60}{\pi}
             + 12 \times 60 \times 60
 
-        :param hour_angle: The hour angle in radians.
-        :type hour_angle: float
+        :param hour_angle: The hour angle in radians, or an array of hour angles.
+        :type hour_angle: float or numpy.ndarray
         :return: The solar time in seconds.
-        :rtype: float
+                 An array is returned if ``hour_angle`` is an array.
+        :rtype: float or numpy.ndarray
         """
-        # The number of seconds in half a day (12 hours)
-        seconds_in_half_day = 12 * 60 * 60
-
-        # The Earth rotates by pi/seconds_in_half_day radians per second
-        earth_rotation_rate = math.pi / seconds_in_half_day
-
-        # Calculate the solar time
-        solar_time = hour_angle / earth_rotation_rate + seconds_in_half_day
-
-        return solar_time
+        return hour_angle / EARTH_ROTATION_RATE + SECONDS_IN_HALF_DAY
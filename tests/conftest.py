@@ -0,0 +1,44 @@
+#    Copyright 2023 Alireza Aghamohammadi
+
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+
+#        http://www.apache.org/licenses/LICENSE-2.0
+
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+import re
+from typing import Callable, Set
+
+import matplotlib
+import pytest
+
+from pysolorie import IrradiationCalculator
+
+# The plot tests only write files, so the non-interactive backend is forced
+# before any test module imports pyplot
+matplotlib.use("Agg", force=True)
+
+# Matches the per-day log messages of the report and plot methods
+DAY_LOG_PATTERN = re.compile(r"On day (\d+),")
+
+
+@pytest.fixture(scope="session")
+def tehran_irradiation_calculator() -> IrradiationCalculator:
+    # Shared so that the optimal orientations memoized by the calculator
+    # are computed once per test session
+    return IrradiationCalculator("MIDLATITUDE SUMMER", 1200, 35.6892)
+
+
+@pytest.fixture
+def logged_days(caplog) -> Callable[[], Set[int]]:
+    # Collects the days mentioned by the per-day log messages captured so far
+    def collect() -> Set[int]:
+        matches = (DAY_LOG_PATTERN.search(record.message) for record in caplog.records)
+        return {int(match.group(1)) for match in matches if match}
+
+    return collect
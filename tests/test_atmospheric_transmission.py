@@ -12,6 +12,7 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+import numpy as np
 import pytest
 
 from pysolorie import AtmosphericTransmission
@@ -46,3 +47,18 @@ def test_calculate_transmittance(
         day_of_year, solar_time
     )
     assert pytest.approx(result, abs=1e-3) == expected_transmittance
+
+
+def test_calculate_transmittance_batch() -> None:
+    atmospheric_transmission: AtmosphericTransmission = AtmosphericTransmission(
+        "MIDLATITUDE SUMMER", 1200, 35.69
+    )
+    days = np.array([1, 81, 172, 355])
+    solar_times = np.array([10, 12, 13, 15]) * 60 * 60
+    result = atmospheric_transmission.calculate_transmittance_batch(days, solar_times)
+    expected = [
+        atmospheric_transmission.calculate_transmittance(int(day), float(time))
+        for day, time in zip(days, solar_times)
+    ]
+    assert result.shape == days.shape
+    assert result == pytest.approx(expected, abs=1e-9)
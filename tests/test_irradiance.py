@@ -12,6 +12,7 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+import numpy as np
 import pytest
 
 from pysolorie import SolarIrradiance, SunPosition
@@ -36,3 +37,16 @@ def test_calculate_extraterrestrial_irradiance(
         day_of_year
     )
     assert irradiance == pytest.approx(expected_irradiance, abs=1e-5)
+
+
+def test_calculate_extraterrestrial_irradiance_array() -> None:
+    sun_position = SunPosition()
+    solar_irradiance = SolarIrradiance(sun_position)
+    days = np.array([1, 81, 172, 264, 355])
+    irradiance = solar_irradiance.calculate_extraterrestrial_irradiance(days)
+    assert isinstance(irradiance, np.ndarray)
+    assert irradiance.shape == days.shape
+    expected = [
+        solar_irradiance.calculate_extraterrestrial_irradiance(int(day)) for day in days
+    ]
+    assert irradiance == pytest.approx(expected, abs=1e-9)
@@ -0,0 +1,34 @@
+#    Copyright 2023 Alireza Aghamohammadi
+
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+
+#        http://www.apache.org/licenses/LICENSE-2.0
+
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+
+import numpy as np
+import pytest
+
+from pysolorie._kernels import _direct_irradiation, _optimal_orientation
+
+
+def test_optimal_orientation() -> None:
+    hour_angles = np.arange(-1.5, 1.5, 0.01)
+    weights = np.full_like(hour_angles, 0.01)
+    betas = np.linspace(-np.pi / 2, np.pi / 2, 10001)
+    irradiations = [
+        _direct_irradiation(np.cos(hour_angles), weights, 0.3, 0.6 - beta)
+        for beta in betas
+    ]
+    beta, irradiation = _optimal_orientation(
+        np.cos(hour_angles), weights, 0.3, 0.6, -np.pi / 2, np.pi / 2, 1e-8
+    )
+    assert beta == pytest.approx(betas[np.argmax(irradiations)], abs=1e-3)
+    assert irradiation == pytest.approx(max(irradiations), abs=1e-9)
@@ -14,11 +14,17 @@
 
 from typing import Tuple
 
+import numpy as np
 import pytest
 
 from pysolorie import HottelModel, exceptions
 
 
+@pytest.fixture(scope="module")
+def hottel_model() -> HottelModel:
+    return HottelModel()
+
+
 @pytest.mark.parametrize(
     "climate_type, observer_altitude, expected_result",
     [
@@ -29,15 +35,15 @@ from pysolorie import HottelModel, exceptions
     ],
 )
 def test_calculate_transmittance_components(
+    hottel_model: HottelModel,
     climate_type: str,
     observer_altitude: int,
     expected_result: Tuple[float, float, float],
 ) -> None:
-    hottel_model: HottelModel = HottelModel()
     result: Tuple[float, float, float] = (
         hottel_model.calculate_transmittance_components(climate_type, observer_altitude)
     )
-    assert pytest.approx(result, abs=1e-3) == expected_result
+    np.testing.assert_allclose(result, expected_result, rtol=0, atol=1e-3)
 
 
 def test_invalid_climate_type() -> None:
@@ -50,3 +56,39 @@ def test_invalid_climate_type_with_custom_message() -> None:
     custom_message = "Custom error message"
     with pytest.raises(exceptions.InvalidClimateTypeError, match=custom_message):
         raise exceptions.InvalidClimateTypeError("INVALID", custom_message)
+
+
+def test_climate_type_property() -> None:
+    hottel_model: HottelModel = HottelModel()
+    hottel_model.climate_type = "tropical"
+    assert hottel_model.climate_type == "TROPICAL"
+    with pytest.raises(exceptions.InvalidClimateTypeError):
+        hottel_model.climate_type = "INVALID"
+
+
+def test_invalid_climate_type_error_type() -> None:
+    hottel_model: HottelModel = HottelModel()
+    with pytest.raises(exceptions.InvalidClimateTypeError) as exc_info:
+        hottel_model.calculate_transmittance_components("INVALID", 1000)
+    assert exc_info.value.climate_type == "INVALID"
+
+
+def test_calculate_transmittance_components_float_altitude() -> None:
+    hottel_model: HottelModel = HottelModel()
+    assert hottel_model.calculate_transmittance_components(
+        "TROPICAL", np.float64(1200.5)
+    ) == pytest.approx(
+        hottel_model.calculate_transmittance_components("TROPICAL", 1200.5)
+    )
+
+
+def test_calculate_transmittance_components_array_altitude(
+    hottel_model: HottelModel,
+) -> None:
+    altitudes = np.array([26.0, 136.0, 1200.0])
+    a0, a1, k = hottel_model.calculate_transmittance_components("TROPICAL", altitudes)
+    expected = [
+        hottel_model.calculate_transmittance_components("TROPICAL", float(altitude))
+        for altitude in altitudes
+    ]
+    np.testing.assert_allclose(np.stack([a0, a1, k], axis=-1), expected)
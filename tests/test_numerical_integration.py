@@ -12,6 +12,7 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+import numpy as np
 import pytest
 
 from pysolorie import IrradiationCalculator
@@ -143,3 +144,92 @@ def test_find_optimal_orientation(
     )
     result = irradiation_calculator.find_optimal_orientation(day_of_year)
     assert pytest.approx(result, abs=1e-3) == expected_result
+
+
+def test_find_optimal_orientation_many(tehran_irradiation_calculator) -> None:
+    irradiation_calculator = tehran_irradiation_calculator
+    days = np.array([1, 172, 355])
+    result = irradiation_calculator.find_optimal_orientation_many(days)
+    assert result.shape == days.shape
+    # A fresh calculator, so that the expected values are not read back
+    # from the results memoized by the batched call
+    reference_calculator = IrradiationCalculator("MIDLATITUDE SUMMER", 1200, 35.6892)
+    assert result == pytest.approx(
+        [reference_calculator.find_optimal_orientation(int(day)) for day in days]
+    )
+    # Around the summer solstice the optimal panel in Tehran is nearly horizontal
+    assert result[1] == pytest.approx(0.17022540291224914, abs=1e-3)
+
+
+def test_find_optimal_orientation_many_polar_night() -> None:
+    irradiation_calculator = IrradiationCalculator("SUBARCTIC SUMMER", 100, 80)
+    result = irradiation_calculator.find_optimal_orientation_many(np.array([1, 172]))
+    # Day 1 is in the polar night, so the fallback orientation is returned
+    assert result == pytest.approx([90, 40.01080151428626], abs=1e-3)
+
+
+def test_calculate_direct_irradiation_many(tehran_irradiation_calculator) -> None:
+    irradiation_calculator = tehran_irradiation_calculator
+    days = np.array([1, 172, 355])
+    result = irradiation_calculator.calculate_direct_irradiation_many(30, days)
+    assert result.shape == days.shape
+    # A fresh calculator, so that the expected values are not read back
+    # from the day profiles memoized by the batched call
+    reference_calculator = IrradiationCalculator("MIDLATITUDE SUMMER", 1200, 35.6892)
+    assert result == pytest.approx(
+        [
+            reference_calculator.calculate_direct_irradiation(30, int(day))
+            for day in days
+        ]
+    )
+    # The values of the original scipy.integrate.simpson integration
+    assert result == pytest.approx(
+        [16.232616679954724, 23.90978393987495, 16.014163248074563], abs=1e-3
+    )
+
+
+def test_find_optimal_orientation_and_value(tehran_irradiation_calculator) -> None:
+    irradiation_calculator = tehran_irradiation_calculator
+    beta, direct_irradiation = (
+        irradiation_calculator.find_optimal_orientation_and_value(172)
+    )
+    assert beta == pytest.approx(irradiation_calculator.find_optimal_orientation(172))
+    assert direct_irradiation == pytest.approx(
+        irradiation_calculator.calculate_direct_irradiation(beta, 172)
+    )
+
+
+def test_find_optimal_orientation_and_value_is_memoized() -> None:
+    # A fresh calculator, so that the first call is not already memoized
+    irradiation_calculator = IrradiationCalculator("MIDLATITUDE SUMMER", 1200, 35.6892)
+    result = irradiation_calculator.find_optimal_orientation_and_value(172)
+    assert irradiation_calculator.find_optimal_orientation_and_value(172) is result
+
+
+def test_day_profile_is_memoized() -> None:
+    # A fresh calculator, so that the first call is not already memoized
+    irradiation_calculator = IrradiationCalculator("MIDLATITUDE SUMMER", 1200, 35.6892)
+    direct_irradiation = irradiation_calculator.calculate_direct_irradiation(30, 172)
+    day_profile = irradiation_calculator._calculate_day_profile(172)
+    assert irradiation_calculator._calculate_day_profile(172) is day_profile
+    assert irradiation_calculator.calculate_direct_irradiation(
+        30, 172
+    ) == pytest.approx(direct_irradiation, abs=1e-12)
+
+
+def test_find_optimal_orientation_and_value_polar_night() -> None:
+    irradiation_calculator = IrradiationCalculator("SUBARCTIC SUMMER", 100, 80)
+    beta, direct_irradiation = (
+        irradiation_calculator.find_optimal_orientation_and_value(1)
+    )
+    assert (beta, direct_irradiation) == (90, 0)
+    assert isinstance(beta, int) and isinstance(direct_irradiation, int)
+    assert irradiation_calculator.calculate_direct_irradiation(beta, 1) == 0
+
+    # The batched variant returns float arrays
+    betas, direct_irradiations = (
+        irradiation_calculator.find_optimal_orientation_and_value_many(np.array([1]))
+    )
+    assert betas.dtype == np.float64 and betas.tolist() == [90.0]
+    assert direct_irradiations.dtype == np.float64
+    assert direct_irradiations.tolist() == [0.0]
@@ -14,6 +14,7 @@
 
 import math
 
+import numpy as np
 import pytest
 
 from pysolorie import Observer
@@ -124,3 +125,75 @@ def test_calculate_sunrise_sunset_invalid_latitude():
             match="Invalid data: Observer latitude. ",
         ):
             observer.calculate_sunrise_sunset(day_of_year=172)
+
+
+def test_calculate_zenith_angle_batch() -> None:
+    observer: Observer = Observer(35.69, 51.39)
+    days = np.array([[1], [81], [355]])
+    solar_times = np.array([10, 12, 13]) * 60 * 60
+    zenith_angles = observer.calculate_zenith_angle_batch(days, solar_times)
+    assert zenith_angles.shape == (3, 3)
+    for i, day in enumerate(days[:, 0]):
+        for j, solar_time in enumerate(solar_times):
+            assert zenith_angles[i, j] == pytest.approx(
+                observer.calculate_zenith_angle(int(day), float(solar_time)),
+                abs=1e-9,
+            )
+
+
+def test_observer_latitude_update() -> None:
+    observer: Observer = Observer(35.69)
+    observer.observer_latitude = 0
+    assert observer.calculate_zenith_angle(81, 12 * 60 * 60) == pytest.approx(
+        0, abs=1e-3
+    )
+    observer.observer_latitude = None
+    with pytest.raises(ValueError, match="Missing required data"):
+        observer.calculate_zenith_angle(81, 12 * 60 * 60)
+
+
+def test_calculate_sunrise_sunset_polar_night():
+    observer = Observer(observer_latitude=80)
+    assert observer.calculate_sunrise_sunset(day_of_year=355) == (0, 0)
+
+
+def test_calculate_sunrise_sunset_array():
+    observer = Observer(observer_latitude=70.00)
+    days = np.array([81, 172, 355])
+    sunrises, sunsets = observer.calculate_sunrise_sunset(days)
+    for day, sunrise, sunset in zip(days, sunrises, sunsets):
+        expected_sunrise, expected_sunset = observer.calculate_sunrise_sunset(int(day))
+        assert sunrise == pytest.approx(expected_sunrise, abs=1e-12)
+        assert sunset == pytest.approx(expected_sunset, abs=1e-12)
+    noon = np.array([12 * 60 * 60])
+    assert observer.calculate_zenith_angle(days, noon) == pytest.approx(
+        [observer.calculate_zenith_angle(int(day), 12 * 60 * 60) for day in days]
+    )
+
+
+def test_calculate_cos_zenith_angle():
+    observer = Observer(observer_latitude=35.69)
+    assert observer.calculate_cos_zenith_angle(81, 10 * 60 * 60) == pytest.approx(
+        math.cos(observer.calculate_zenith_angle(81, 10 * 60 * 60))
+    )
+    days = np.array([1, 81, 172])
+    solar_times = np.array([10 * 60 * 60])
+    assert observer.calculate_cos_zenith_angle(days, solar_times) == pytest.approx(
+        np.cos(observer.calculate_zenith_angle_batch(days, solar_times))
+    )
+    solar_times = np.array([8, 10, 12, 14]) * 60 * 60
+    assert observer.calculate_cos_zenith_angle(
+        np.asarray(172), solar_times
+    ) == pytest.approx(
+        [observer.calculate_cos_zenith_angle(172, float(t)) for t in solar_times]
+    )
+
+
+def test_calculate_zenith_angle_at_noon():
+    observer = Observer(observer_latitude=35.69)
+    for day_of_year in (1, 81, 172, 355):
+        assert observer.calculate_zenith_angle(
+            day_of_year, 12 * 60 * 60
+        ) == pytest.approx(
+            math.acos(observer.calculate_cos_zenith_angle(day_of_year, 12 * 60 * 60))
+        )
@@ -14,16 +14,50 @@
 
 import logging
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 from unittest.mock import MagicMock
 
 import matplotlib.pyplot as plt
-import numpy as np
+import pytest
+from matplotlib.figure import Figure
 
 from pysolorie import IrradiationCalculator, Plotter
 
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
 
-def test_plot_optimal_orientation(caplog, tmpdir) -> None:
+
+@pytest.fixture(autouse=True)
+def close_figures():
+    # Figures that are shown rather than saved stay registered with pyplot,
+    # so they are released after every test
+    yield
+    plt.close("all")
+
+
+@pytest.fixture
+def saved_figures(monkeypatch) -> List[Tuple[Figure, Path]]:
+    # The plot_* tests only check that the figure is saved to the given path,
+    # so rendering is skipped and only the PNG signature is written.
+    # test_plot_saves_png still renders a real image.
+    saved: List[Tuple[Figure, Path]] = []
+
+    def savefig(self, path, **kwargs) -> None:
+        saved.append((self, Path(path)))
+        Path(path).write_bytes(PNG_SIGNATURE)
+
+    monkeypatch.setattr(Figure, "savefig", savefig)
+    return saved
+
+
+@pytest.mark.parametrize("to_day", [62, pytest.param(70, marks=pytest.mark.slow)])
+def test_plot_optimal_orientation(
+    caplog,
+    logged_days,
+    saved_figures,
+    tmpdir,
+    tehran_irradiation_calculator,
+    to_day: int,
+) -> None:
     caplog.set_level(logging.INFO)
 
     # Create a temporary directory for the test
@@ -32,35 +66,37 @@ def test_plot_optimal_orientation(caplog, tmpdir) -> None:
     # Initialize the Plotter
     plotter: Plotter = Plotter()
 
-    # Initialize the IrradiationCalculator for Tehran
-    irradiation_calculator: IrradiationCalculator = IrradiationCalculator(
-        "MIDLATITUDE SUMMER", 1200, 35.6892
-    )
+    # The IrradiationCalculator for Tehran
+    irradiation_calculator: IrradiationCalculator = tehran_irradiation_calculator
 
     # Define the path for the plot
     plot_path: Path = temp_dir / "plot.png"
     from_day: int = 60
-    to_day: int = 70
     # Call the method to generate the plot
     plotter.plot_optimal_orientation(
         irradiation_calculator, from_day, to_day, plot_path
     )
 
-    # Check the plot file
+    # Check the plot file and the plotted days
+    [(figure, saved_path)] = saved_figures
+    assert saved_path == plot_path
     assert plot_path.exists(), "The plot file was not created."
-
-    img: np.ndarray = plt.imread(plot_path)
-    assert img.shape[0] > 0, "The plot image has no content."
-    assert img.shape[1] > 0, "The plot image has no content."
+    assert list(figure.axes[0].lines[0].get_xdata()) == list(range(from_day, to_day))
 
     # Check the logs
-    for day in range(from_day, to_day):
-        assert any(
-            f"On day {day}," in record.message for record in caplog.records
-        ), f"No log message for day {day}"
-
-
-def test_plot_total_direct_irradiation(caplog, tmpdir) -> None:
+    missing_days = set(range(from_day, to_day)) - logged_days()
+    assert not missing_days, f"No log message for days {sorted(missing_days)}"
+
+
+@pytest.mark.parametrize("to_day", [62, pytest.param(70, marks=pytest.mark.slow)])
+def test_plot_total_direct_irradiation(
+    caplog,
+    logged_days,
+    saved_figures,
+    tmpdir,
+    tehran_irradiation_calculator,
+    to_day: int,
+) -> None:
     caplog.set_level(logging.INFO)
 
     # Create a temporary directory for the test
@@ -69,32 +105,26 @@ def test_plot_total_direct_irradiation(caplog, tmpdir) -> None:
     # Initialize the Plotter
     plotter: Plotter = Plotter()
 
-    # Initialize the IrradiationCalculator for Tehran
-    irradiation_calculator: IrradiationCalculator = IrradiationCalculator(
-        "MIDLATITUDE SUMMER", 1200, 35.6892
-    )
+    # The IrradiationCalculator for Tehran
+    irradiation_calculator: IrradiationCalculator = tehran_irradiation_calculator
 
     # Define the path for the plot
     plot_path: Path = temp_dir / "plot.png"
     from_day: int = 60
-    to_day: int = 70
     # Call the method to generate the plot
     plotter.plot_total_direct_irradiation(
         irradiation_calculator, from_day, to_day, plot_path
     )
 
-    # Check the plot file
+    # Check the plot file and the plotted days
+    [(figure, saved_path)] = saved_figures
+    assert saved_path == plot_path
     assert plot_path.exists(), "The plot file was not created."
-
-    img: np.ndarray = plt.imread(plot_path)
-    assert img.shape[0] > 0, "The plot image has no content."
-    assert img.shape[1] > 0, "The plot image has no content."
+    assert list(figure.axes[0].lines[0].get_xdata()) == list(range(from_day, to_day))
 
     # Check the logs
-    for day in range(from_day, to_day):
-        assert any(
-            f"On day {day}," in record.message for record in caplog.records
-        ), f"No log message for day {day}"
+    missing_days = set(range(from_day, to_day)) - logged_days()
+    assert not missing_days, f"No log message for days {sorted(missing_days)}"
 
 
 def test_plot_method() -> None:
@@ -112,3 +142,16 @@ def test_plot_method() -> None:
     # Call the method
     plotter._plot(days, betas, path, plot_kwargs, savefig_kwargs)
     plt.show.assert_called_once()
+
+
+def test_plot_saves_png(tmpdir) -> None:
+    plotter: Plotter = Plotter()
+    plot_path: Path = Path(tmpdir) / "plot.png"
+    plotter._plot([1, 2, 3], [10.0, 20.0, 30.0], plot_path, {}, {})
+
+    # The image is rendered, only the PNG signature is read back
+    with open(plot_path, "rb") as file:
+        assert file.read(8) == PNG_SIGNATURE, "The plot file is not a PNG."
+    assert plot_path.stat().st_size > 1000, "The plot image has no content."
+    # The saved figure is closed
+    assert plt.get_fignums() == []
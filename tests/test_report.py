@@ -17,163 +17,167 @@ import json
 import logging
 import xml.etree.ElementTree as ET
 from pathlib import Path
+from typing import Callable, Dict, List, Tuple
 
+import numpy as np
 import pytest
 
-from pysolorie import IrradiationCalculator, ReportGenerator
-
-
-def test_generate_optimal_orientation_csv_report(caplog, tmpdir) -> None:
-    caplog.set_level(logging.INFO)
-
-    # Create a temporary directory for the test
-    temp_dir: Path = Path(tmpdir)
-
-    # Initialize the ReportGenerator
-    report_generator: ReportGenerator = ReportGenerator()
-
-    # Initialize the IrradiationCalculator for Tehran
-    irradiation_calculator: IrradiationCalculator = IrradiationCalculator(
-        "MIDLATITUDE SUMMER", 1200, 35.6892
-    )
-
-    # Define the path for the CSV file
-    csv_path: Path = temp_dir / "report.csv"
-    from_day: int = 60
-    to_day: int = 70
-    # Call the method to generate the report
-    report_generator.generate_optimal_orientation_csv_report(
-        csv_path, irradiation_calculator, from_day, to_day
-    )
-
-    # Check the CSV file
-    with open(csv_path, "r") as file:
-        reader = csv.reader(file)
-        header = next(reader)
+from pysolorie import IrradiationCalculator, ReportGenerator, exceptions
+
+
+@pytest.fixture(scope="module")
+def report_generator() -> ReportGenerator:
+    return ReportGenerator()
+
+
+# Optimal orientation (degrees) and direct irradiation (MJ/m^2) for Tehran,
+# as produced by the original scipy.integrate.simpson and
+# scipy.optimize.minimize_scalar implementation
+TEHRAN_EXPECTED_ROWS: Dict[int, Tuple[float, float]] = {
+    60: (46.699519768705414, 22.517336358506036),
+    61: (46.22360506419229, 22.56780828205513),
+    62: (45.74188916975112, 22.61767038937977),
+    63: (45.254687327494345, 22.666939060577434),
+    64: (44.762114639877694, 22.715632616618894),
+    65: (44.264255054759346, 22.763771292313713),
+    66: (43.7612246877753, 22.81137709945803),
+    67: (43.25314447651896, 22.858473772188926),
+    68: (42.74014008279065, 22.90508663158175),
+    69: (42.22234212053418, 22.951242507828265),
+}
+
+
+def _check_report_rows(
+    from_day: int, to_day: int, rows: List[Tuple[int, float, float]]
+) -> None:
+    days = [day for day, _, _ in rows]
+    assert days == list(range(from_day, to_day))
+    expected_rows = np.array([TEHRAN_EXPECTED_ROWS[day] for day in days])
+    actual_rows = np.array([(beta, irradiation) for _, beta, irradiation in rows])
+    # The optimizer stops within its tolerance of the optimum,
+    # so both quantities are compared to within 1e-3
+    np.testing.assert_allclose(actual_rows, expected_rows, rtol=0, atol=1e-3)
+
+
+def _read_csv_report(path: Path) -> List[Tuple[int, float, float]]:
+    with open(path, "r") as file:
+        header = next(csv.reader(file))
         assert header == [
             "Day",
             "Beta (degrees)",
             "Direct Irradiation (Megajoules per square meter)",
         ]
-        for i, row in enumerate(reader, start=from_day):
-            day, beta, total_direct_irradiation = (
-                int(row[0]),
-                float(row[1]),
-                float(row[2]),
-            )
-
-            assert day == i
-            expected_beta = irradiation_calculator.find_optimal_orientation(i)
-
-            expected_total_direct_irradiation = (
-                irradiation_calculator.calculate_direct_irradiation(beta, i)
-            )
-            assert pytest.approx(beta, abs=1e-3) == expected_beta
-            assert (
-                pytest.approx(total_direct_irradiation, abs=1e-3)
-                == expected_total_direct_irradiation
-            )
-    # Check the logs
-    for day in range(from_day, to_day):
-        assert any(
-            f"On day {day}," in record.message for record in caplog.records
-        ), f"No log message for day {day}"
+        # The numeric body is parsed in one call
+        data = np.loadtxt(file, delimiter=",", ndmin=2)
+    return [(int(day), beta, irradiation) for day, beta, irradiation in data.tolist()]
 
 
-def test_generate_optimal_orientation_json_report(caplog, tmpdir) -> None:
-    caplog.set_level(logging.INFO)
-
-    # Create a temporary directory for the test
-    temp_dir: Path = Path(tmpdir)
-
-    # Initialize the ReportGenerator
-    report_generator: ReportGenerator = ReportGenerator()
-
-    # Initialize the IrradiationCalculator for Tehran
-    irradiation_calculator: IrradiationCalculator = IrradiationCalculator(
-        "MIDLATITUDE SUMMER", 1200, 35.6892
-    )
-
-    # Define the path for the JSON file
-    json_path: Path = temp_dir / "report.json"
-    from_day: int = 60
-    to_day: int = 70
-    # Call the method to generate the report
-    report_generator.generate_optimal_orientation_json_report(
-        json_path, irradiation_calculator, from_day, to_day
-    )
-
-    # Check the JSON file
-    with open(json_path, "r") as file:
+def _read_json_report(path: Path) -> List[Tuple[int, float, float]]:
+    with open(path, "r") as file:
         data = json.load(file)
-        for i, row in enumerate(data, start=from_day):
-            day, beta, direct_irradiation = (
-                row["Day"],
-                row["Beta (degrees)"],
-                row["Direct Irradiation (Megajoules per square meter)"],
-            )
-
-            assert day == i
-            expected_beta = irradiation_calculator.find_optimal_orientation(i)
-            expected_direct_irradiation = (
-                irradiation_calculator.calculate_direct_irradiation(beta, i)
-            )
-            assert pytest.approx(beta, abs=1e-3) == expected_beta
-            assert (
-                pytest.approx(direct_irradiation, abs=1e-3)
-                == expected_direct_irradiation
-            )
-    # Check the logs
-    for day in range(from_day, to_day):
-        assert any(
-            f"On day {day}," in record.message for record in caplog.records
-        ), f"No log message for day {day}"
+    return [
+        (
+            row["Day"],
+            row["Beta (degrees)"],
+            row["Direct Irradiation (Megajoules per square meter)"],
+        )
+        for row in data
+    ]
 
 
-def test_generate_optimal_orientation_xml_report(caplog, tmpdir) -> None:
+def _read_xml_report(path: Path) -> List[Tuple[int, float, float]]:
+    tree = ET.parse(path)
+    root = tree.getroot()
+    return [
+        (
+            int(day_element.get("id")),
+            float(day_element.find("Beta").text),
+            float(day_element.find("DirectIrradiation").text),
+        )
+        for day_element in root.findall("Day")
+    ]
+
+
+# The ReportGenerator method and the reader of each report format
+REPORT_FORMATS: Dict[
+    str, Tuple[str, Callable[[Path], List[Tuple[int, float, float]]]]
+] = {
+    "csv": ("generate_optimal_orientation_csv_report", _read_csv_report),
+    "json": ("generate_optimal_orientation_json_report", _read_json_report),
+    "xml": ("generate_optimal_orientation_xml_report", _read_xml_report),
+}
+
+
+@pytest.mark.parametrize("to_day", [63, pytest.param(70, marks=pytest.mark.slow)])
+@pytest.mark.parametrize("report_format", REPORT_FORMATS)
+def test_generate_optimal_orientation_report(
+    caplog,
+    logged_days,
+    tmpdir,
+    report_generator,
+    tehran_irradiation_calculator,
+    report_format: str,
+    to_day: int,
+) -> None:
     caplog.set_level(logging.INFO)
 
     # Create a temporary directory for the test
     temp_dir: Path = Path(tmpdir)
 
-    # Initialize the ReportGenerator
-    report_generator: ReportGenerator = ReportGenerator()
-
-    # Initialize the IrradiationCalculator for Tehran
-    irradiation_calculator: IrradiationCalculator = IrradiationCalculator(
-        "MIDLATITUDE SUMMER", 1200, 35.6892
-    )
+    # The IrradiationCalculator for Tehran
+    irradiation_calculator: IrradiationCalculator = tehran_irradiation_calculator
 
-    # Define the path for the XML file
-    xml_path: Path = temp_dir / "report.xml"
+    # Define the path for the report file
+    report_path: Path = temp_dir / f"report.{report_format}"
     from_day: int = 60
-    to_day: int = 70
+    generate_report_name, read_report = REPORT_FORMATS[report_format]
     # Call the method to generate the report
-    report_generator.generate_optimal_orientation_xml_report(
-        xml_path, irradiation_calculator, from_day, to_day
+    getattr(report_generator, generate_report_name)(
+        report_path, irradiation_calculator, from_day, to_day
     )
 
-    # Check the XML file
-    tree = ET.parse(xml_path)
-    root = tree.getroot()
-
-    for i, day_element in enumerate(root.findall("Day"), start=from_day):
-        day = int(day_element.get("id"))
-        beta = float(day_element.find("Beta").text)
-        total_direct_irradiation = float(day_element.find("DirectIrradiation").text)
+    # Check the report file
+    rows = read_report(report_path)
+    _check_report_rows(from_day, to_day, rows)
 
-        assert day == i
-        expected_beta = irradiation_calculator.find_optimal_orientation(i)
-        expected_total_direct_irradiation = (
-            irradiation_calculator.calculate_direct_irradiation(beta, i)
-        )
-        assert pytest.approx(beta, abs=1e-3) == expected_beta
-        assert (
-            pytest.approx(total_direct_irradiation, abs=1e-3)
-            == expected_total_direct_irradiation
-        )
     # Check the logs
-    for day in range(from_day, to_day):
-        assert any(
-            f"On day {day}," in record.message for record in caplog.records
-        ), f"No log message for day {day}"
+    missing_days = set(range(from_day, to_day)) - logged_days()
+    assert not missing_days, f"No log message for days {sorted(missing_days)}"
+
+
+@pytest.mark.parametrize("report_format", REPORT_FORMATS)
+def test_generate_optimal_orientation_report_error_keeps_file(
+    tmpdir, report_generator, report_format: str
+) -> None:
+    # The calculation fails before the existing report file is opened
+    report_path: Path = Path(tmpdir) / f"report.{report_format}"
+    report_path.write_text("previous report")
+    irradiation_calculator = IrradiationCalculator("MIDLATITUDE SUMMER", 1200, 100)
+    generate_report_name, _ = REPORT_FORMATS[report_format]
+    with pytest.raises(exceptions.InvalidObserverLatitudeError):
+        getattr(report_generator, generate_report_name)(
+            report_path, irradiation_calculator, 60, 63
+        )
+    assert report_path.read_text() == "previous report"
+
+
+@pytest.mark.parametrize(
+    "report_format, expected_text",
+    [
+        ("csv", "1,90,0"),
+        ("json", '"Beta (degrees)": 90,'),
+        ("xml", "<Beta>90</Beta><DirectIrradiation>0</DirectIrradiation>"),
+    ],
+)
+def test_generate_optimal_orientation_report_polar_night(
+    tmpdir, report_generator, report_format: str, expected_text: str
+) -> None:
+    # During polar night the fallback orientation and irradiation
+    # are written as integers
+    report_path: Path = Path(tmpdir) / f"report.{report_format}"
+    irradiation_calculator = IrradiationCalculator("SUBARCTIC SUMMER", 100, 80)
+    generate_report_name, _ = REPORT_FORMATS[report_format]
+    getattr(report_generator, generate_report_name)(
+        report_path, irradiation_calculator, 1, 2
+    )
+    assert expected_text in report_path.read_text()
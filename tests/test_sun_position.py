@@ -14,6 +14,7 @@
 
 import math
 
+import numpy as np
 import pytest
 
 from pysolorie import SunPosition
@@ -41,6 +42,25 @@ def test_sun_position(
     assert hour_angle == pytest.approx(expected_hour_angle, abs=1e-3)
 
 
+def test_sun_position_array() -> None:
+    # The cases of test_sun_position evaluated in one call per method
+    sun_position: SunPosition = SunPosition()
+    days = np.array([1, 81, 81, 1])
+    solar_times = np.array([12, 10, 12, 13]) * 60 * 60
+    np.testing.assert_allclose(
+        sun_position.solar_declination(days),
+        [-0.4014257279586958, 0, 0, -0.4014257279586958],
+        atol=1e-3,
+    )
+    hour_angles = sun_position.hour_angle(solar_times)
+    np.testing.assert_allclose(
+        hour_angles, [0, -math.pi / 6, 0, math.pi / 12], atol=1e-3
+    )
+    np.testing.assert_allclose(
+        sun_position.solar_time(hour_angles), solar_times, atol=1e-3
+    )
+
+
 @pytest.mark.parametrize(
     "hour_angle, expected_solar_time",
     [
@@ -57,3 +77,44 @@ def test_solar_time(
     sun_position: SunPosition = SunPosition()
     solar_time: float = sun_position.solar_time(hour_angle)
     assert solar_time == pytest.approx(expected_solar_time, abs=1e-3)
+
+
+def test_solar_declination_lookup() -> None:
+    sun_position: SunPosition = SunPosition()
+    days = np.array([1, 81, 172, 365, 366])
+    expected = [sun_position.solar_declination(float(day)) for day in days]
+    assert sun_position.solar_declination(days) == pytest.approx(expected, abs=1e-12)
+    assert sun_position.solar_declination(days.astype(float)) == pytest.approx(
+        expected, abs=1e-12
+    )
+    for day, declination in zip(days, expected):
+        assert sun_position.solar_declination(int(day)) == pytest.approx(
+            declination, abs=1e-12
+        )
+
+
+def test_spencer_solar_declination() -> None:
+    sun_position: SunPosition = SunPosition()
+    days = np.arange(1, 366)
+    day_angles = 2 * np.pi * (days - 1) / 365
+    expected = (
+        0.006918
+        - 0.399912 * np.cos(day_angles)
+        + 0.070257 * np.sin(day_angles)
+        - 0.006758 * np.cos(2 * day_angles)
+        + 0.000907 * np.sin(2 * day_angles)
+        - 0.002697 * np.cos(3 * day_angles)
+        + 0.00148 * np.sin(3 * day_angles)
+    )
+    np.testing.assert_allclose(
+        sun_position.spencer_solar_declination(days), expected, atol=1e-12
+    )
+    assert sun_position.spencer_solar_declination(172) == pytest.approx(
+        expected[171], abs=1e-12
+    )
+    # Within about 1.5 degrees of the single-term formula
+    np.testing.assert_allclose(
+        sun_position.spencer_solar_declination(days),
+        sun_position.solar_declination(days),
+        atol=0.03,
+    )